@@ -0,0 +1,54 @@
+"""Hatchling build hook: pre-compile packaged defaults to a Python module.
+
+Parsing ``defaults/config.yaml`` on every process start costs a full YAML
+parse; writing the parsed dict out as a literal at wheel build time turns
+the packaged-defaults layer into a plain module import. The runtime loader
+falls back to parsing the YAML when ``_compiled.py`` is absent (editable
+installs, source checkouts).
+
+The compiled module is generated in a temporary directory and injected
+into the wheel via ``force_include`` so the source tree never contains a
+stale ``_compiled.py`` shadowing later edits to ``defaults/config.yaml``.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+_HEADER = '"""Generated by hatch_build.py from {source}; do not edit."""\n\n'
+_TARGET = "evosuite/agent_os/defaults/_compiled.py"
+
+
+class CompileDefaultsHook(BuildHookInterface):
+    _tmp_dir = None
+
+    def initialize(self, version, build_data):
+        defaults_dir = Path(self.root) / "src" / "evosuite" / "agent_os" / "defaults"
+        # Same JSON-first order as config.CONFIG_FILENAMES, so a wheel
+        # bakes in the identical file a source checkout would pick at
+        # runtime if the defaults directory ever holds both formats.
+        for name in ("config.json", "config.yaml", "config.yml"):
+            source = defaults_dir / name
+            if not source.exists():
+                continue
+            if source.suffix == ".json":
+                import json
+
+                data = json.loads(source.read_bytes())
+            else:
+                import yaml
+
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                data = yaml.load(source.read_bytes(), Loader=loader) or {}
+            self._tmp_dir = Path(tempfile.mkdtemp(prefix="evosuite-defaults-"))
+            compiled = self._tmp_dir / "_compiled.py"
+            compiled.write_text(_HEADER.format(source=name) + f"DEFAULTS = {data!r}\n")
+            build_data["force_include"][str(compiled)] = _TARGET
+            return
+
+    def finalize(self, version, build_data, artifact_path):
+        if self._tmp_dir is not None:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+            self._tmp_dir = None
@@ -2,11 +2,21 @@
 
 __version__ = "0.2.0"
 
-# Core imports for public API
-from .agent_os.config import load_agent_os_config
-from .agent_os.coordinator import AgentCoordinator
-
+# Public API re-exports resolve lazily (PEP 562) so `import evosuite`
+# doesn't drag in asyncio/yaml for entry points that never touch them.
 __all__ = [
     "load_agent_os_config",
     "AgentCoordinator",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    if name == "load_agent_os_config":
+        from .agent_os.config import load_agent_os_config
+
+        return load_agent_os_config
+    if name == "AgentCoordinator":
+        from .agent_os.coordinator import AgentCoordinator
+
+        return AgentCoordinator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,23 +16,63 @@ Provides single entry point: load_agent_os_config(root_path: Path) -> dict
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
+import copy
+import functools
 import json
 import os
 import sys
+import threading
 
 try:  # Optional dependency guard
     import yaml  # type: ignore
+
+    # Prefer the libyaml-backed loader when available; the pure-Python
+    # SafeLoader is an order of magnitude slower on the same documents.
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except Exception:  # pragma: no cover
     yaml = None  # type: ignore
+    _YamlLoader = None  # type: ignore
+
+try:  # Optional dependency guard
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:  # Optional dependency guard
+    import msgpack  # type: ignore
+    import xxhash  # type: ignore
+except Exception:  # pragma: no cover
+    msgpack = None  # type: ignore
+    xxhash = None  # type: ignore
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps_canon(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+else:
+    _json_loads = json.loads
+
+    def _json_dumps_canon(obj: Any) -> str:  # type: ignore[misc]
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"))
 
-CONFIG_FILENAMES = ["config.yaml", "config.yml", "config.json"]
 
+CONFIG_FILENAMES = ["config.json", "config.yaml", "config.yml"]
 
+
+_PKG_DEFAULTS_DIR = Path(__file__).parent / "defaults"
+
+
+@functools.lru_cache(maxsize=1)
 def _platform_user_config_root() -> Path:
     """Return the user-level base directory for global Agent OS config.
 
+    The result cannot change within a process, so it is computed once.
+
     macOS: ~/Library/Application Support/EvoSuite/agent-os
     Linux: ~/.config/evosuite/agent-os
     Windows: %APPDATA%/EvoSuite/agent-os
@@ -48,108 +88,436 @@ def _platform_user_config_root() -> Path:
 
 
 def _load_file(path: Path) -> dict:
-    if not path.exists():
+    try:
+        # Open directly rather than stat-then-open: a missing file costs one
+        # failed open instead of two syscalls, which matters on networked
+        # filesystems.
+        data = path.read_bytes()
+    except FileNotFoundError:
         return {}
+    except OSError as exc:
+        # Unreadable file, config.json that's a directory, etc. — degrade
+        # to the error marker like any other load failure.
+        return {"_error": f"Failed loading {path.name}: {exc}"}
     try:
+        # Hand the raw bytes straight to the parsers (both accept bytes and
+        # decode in C); decoding via read_text() would double the data moved
+        # through Python strings.
+        if data[:3] == b"\xef\xbb\xbf":  # UTF-8 BOM
+            data = data[3:]
         if path.suffix in (".yaml", ".yml") and yaml is not None:
-            return yaml.safe_load(path.read_text()) or {}
+            return yaml.load(data, Loader=_YamlLoader) or {}
         if path.suffix == ".json":
-            return json.loads(path.read_text())
+            return _json_loads(data)
     except Exception as exc:  # pragma: no cover - logged upstream later
         return {"_error": f"Failed loading {path.name}: {exc}"}
     return {}
 
 
+def _str_keys_only(obj: Any) -> bool:
+    """Return True if every dict key in ``obj`` is a string.
+
+    stdlib json.dumps silently stringifies int/bool keys (YAML produces
+    them), which would corrupt a round-trip copy instead of raising.
+    """
+    if isinstance(obj, dict):
+        return all(
+            isinstance(k, str) and _str_keys_only(v) for k, v in obj.items()
+        )
+    if isinstance(obj, list):
+        return all(_str_keys_only(item) for item in obj)
+    return True
+
+
+def _copy_config(cfg: dict) -> dict:
+    """Deep-copy a config dict via a JSON round trip.
+
+    Config layers only hold JSON-compatible data, for which serialize +
+    parse is markedly cheaper than copy.deepcopy's per-object dispatch.
+    Values JSON cannot represent faithfully — datetimes and dates from
+    YAML timestamps, non-string dict keys, objects from programmatic
+    callers — fall back to deepcopy rather than being silently coerced.
+    """
+    try:
+        if orjson is not None:
+            # OPT_PASSTHROUGH_DATETIME makes datetime/date/time raise
+            # TypeError instead of serializing to strings; orjson already
+            # rejects non-str keys without OPT_NON_STR_KEYS.
+            return orjson.loads(
+                orjson.dumps(cfg, option=orjson.OPT_PASSTHROUGH_DATETIME)
+            )
+        if not _str_keys_only(cfg):
+            return copy.deepcopy(cfg)
+        return json.loads(json.dumps(cfg))
+    except TypeError:
+        return copy.deepcopy(cfg)
+
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _sort_dict_keys(obj: Any) -> Any:
+    """Recursively order dict keys so structurally equal items encode alike."""
+    if isinstance(obj, dict):
+        return {k: _sort_dict_keys(obj[k]) for k in sorted(obj)}
+    if isinstance(obj, list):
+        return [_sort_dict_keys(item) for item in obj]
+    return obj
+
+
+if msgpack is not None and xxhash is not None:
+
+    def _dedup_key(item: Any) -> Any:
+        # msgpack encode + xxh3 is several times cheaper per element than
+        # canonical JSON; key sorting happens before packing since msgpack
+        # has no sort_keys option.
+        return xxhash.xxh3_64_intdigest(msgpack.packb(_sort_dict_keys(item)))
+
+else:
+
+    def _dedup_key(item: Any) -> Any:
+        return _json_dumps_canon(item)
+
+
+def _merge_lists(base: list, incoming: list) -> None:
+    """Append items from ``incoming`` to ``base``, skipping duplicates.
+
+    Lists of plain scalars (the common case for config lists) dedup with a
+    direct set of the values; only lists containing dicts or nested lists
+    fall back to canonical encoding (:func:`_dedup_key`) for membership
+    tests.
+    """
+    if all(isinstance(item, _SCALAR_TYPES) for item in base) and all(
+        isinstance(item, _SCALAR_TYPES) for item in incoming
+    ):
+        # Key on (type, value): a plain set would conflate True/1/1.0,
+        # which the canonical-JSON keys keep distinct.
+        existing = {(type(item), item) for item in base}
+        for item in incoming:
+            key = (type(item), item)
+            if key not in existing:
+                base.append(item)
+                existing.add(key)
+        return
+    # Identity check first: re-merged configs often share the exact same
+    # item objects, and id() membership skips serializing them at all. The
+    # encoded-key set is built lazily on the first object we haven't seen.
+    seen_ids = {id(item) for item in base}
+    existing = None
+    for item in incoming:
+        if id(item) in seen_ids:
+            continue
+        if existing is None:
+            existing = {_dedup_key(item) for item in base}
+        encoded = _dedup_key(item)
+        if encoded not in existing:
+            base.append(item)
+            existing.add(encoded)
+            seen_ids.add(id(item))
+
+
+_MISSING = object()
+
+
 def _deep_merge(base: Dict[str, Any], incoming: Dict[str, Any]) -> Dict[str, Any]:
-    for k, v in incoming.items():
-        if k not in base:
-            base[k] = v
+    if not incoming:
+        return base
+    # Iterative merge: an explicit stack of (base, incoming) dict pairs
+    # avoids Python call overhead per nesting level and any recursion limit
+    # on pathologically deep configs.
+    stack = [(base, incoming)]
+    while stack:
+        b, inc = stack.pop()
+        if not b:
+            # Nothing to reconcile; bulk-copy the layer in C.
+            b.update(inc)
             continue
-        if isinstance(base[k], dict) and isinstance(v, dict):
-            _deep_merge(base[k], v)
-        elif isinstance(base[k], list) and isinstance(v, list):
-            existing = set(json.dumps(item, sort_keys=True) for item in base[k])
-            for item in v:
-                encoded = json.dumps(item, sort_keys=True)
-                if encoded not in existing:
-                    base[k].append(item)
-                    existing.add(encoded)
-        else:
-            base[k] = v
+        for k, v in inc.items():
+            cur = b.get(k, _MISSING)
+            if cur is _MISSING:
+                b[k] = v
+            elif isinstance(cur, dict) and isinstance(v, dict):
+                stack.append((cur, v))
+            elif isinstance(cur, list) and isinstance(v, list):
+                _merge_lists(cur, v)
+            else:
+                b[k] = v
     return base
 
 
-def _collect_layer_config(dir_path: Path) -> dict:
+def _load_file_header(path: Path, max_bytes: int = 4096) -> dict:
+    """Parse only the leading portion of a YAML config.
+
+    Reads the first ``max_bytes`` and truncates at the last top-level key
+    boundary (a line starting neither with whitespace nor ``-``) so the
+    prefix is valid YAML on its own. Callers that only need top-level keys
+    such as ``version`` avoid parsing the full document; any parse failure
+    falls back to a full :func:`_load_file`.
+    """
+    if path.suffix not in (".yaml", ".yml") or yaml is None:
+        return _load_file(path)
+    try:
+        with path.open("rb") as fp:
+            head = fp.read(max_bytes + 1)
+        if len(head) > max_bytes:
+            # Drop the trailing partial line, then any indented/sequence
+            # continuation lines so we end on a complete top-level entry.
+            lines = head[:max_bytes].split(b"\n")
+            dropped_block = lines.pop()[:1] in (b" ", b"\t", b"-")
+            while lines and lines[-1][:1] in (b" ", b"\t", b"-"):
+                lines.pop()
+                dropped_block = True
+            if dropped_block and lines:
+                # The last retained top-level key just lost its block; kept
+                # as-is it would parse as `key: None` and scalar-override a
+                # real dict from a lower layer when merged. Omit it — a
+                # missing key is safe where a wrong value is not.
+                lines.pop()
+            head = b"\n".join(lines)
+        return yaml.load(head, Loader=_YamlLoader) or {}
+    except Exception:
+        return _load_file(path)
+
+
+def _load_yaml_cached(path: Path) -> dict:
+    """Load a YAML config, consulting a parsed-JSON sidecar when fresh.
+
+    A ``<name>.cache.json`` written next to the YAML is reused as long as
+    its mtime is at least the YAML's, so warm loads skip the YAML parser
+    entirely. The sidecar is written atomically and treated as best-effort:
+    read-only layer directories simply fall back to parsing every time.
+    """
+    cache_path = path.with_suffix(path.suffix + ".cache.json")
+    try:
+        if cache_path.stat().st_mtime >= path.stat().st_mtime:
+            return _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    result = _load_file(path)
+    if "_error" not in result:
+        try:
+            if orjson is not None:
+                encoded = orjson.dumps(
+                    result, option=orjson.OPT_PASSTHROUGH_DATETIME
+                )
+            else:
+                encoded = json.dumps(result).encode()
+            # Only persist when the parse survives the round trip; a YAML
+            # timestamp or non-str key would otherwise make every warm
+            # load diverge from a cold parse of the same file.
+            if _json_loads(encoded) == result:
+                tmp_path = cache_path.with_suffix(".tmp")
+                tmp_path.write_bytes(encoded)
+                tmp_path.replace(cache_path)
+        except (OSError, TypeError):  # pragma: no cover - cache is optional
+            pass
+    return result
+
+
+# Parsed layer files keyed by path -> (mtime_ns, result). Lets a reload
+# where only one layer changed skip re-parsing the untouched ones.
+_LAYER_CACHE: Dict[Path, Tuple[int, dict]] = {}
+
+
+def _collect_layer_config(dir_path: Path, shallow: bool = False) -> dict:
     for name in CONFIG_FILENAMES:
         candidate = dir_path / name
-        if candidate.exists():
+        # A single stat() both probes existence and fetches the mtime the
+        # layer cache keys on; no separate exists() check.
+        try:
+            mtime_ns = candidate.stat().st_mtime_ns
+        except OSError:
+            continue
+        if shallow:
+            if candidate.suffix in (".yaml", ".yml"):
+                return _load_file_header(candidate)
             return _load_file(candidate)
+        cached = _LAYER_CACHE.get(candidate)
+        if cached is not None and cached[0] == mtime_ns:
+            return _copy_config(cached[1])
+        if candidate.suffix in (".yaml", ".yml"):
+            result = _load_yaml_cached(candidate)
+        else:
+            result = _load_file(candidate)
+        if "_error" not in result:
+            _LAYER_CACHE[candidate] = (mtime_ns, _copy_config(result))
+        return result
     return {}
 
 
+_ENV_PREFIX = "EVOSUITE_AGENT_OS_"
+_ENV_PREFIX_LEN = len(_ENV_PREFIX)
+
+# Common boolean spellings resolved without touching the JSON parser;
+# other casings fall back to a value.lower() lookup to keep the
+# case-insensitive coercion the env contract always had.
+_ENV_LITERALS: Dict[str, Any] = {
+    "true": True,
+    "false": False,
+    "True": True,
+    "False": False,
+    "TRUE": True,
+    "FALSE": False,
+}
+
+# Leading characters that can start a JSON document; anything else is a
+# bare string and skips the exception-driven json.loads attempt.
+_JSON_LEAD_CHARS = frozenset('{["tfn0123456789-')
+
+# value string -> coerced result, shared across loads so an unchanged
+# environment never re-parses the same value twice.
+_COERCE_CACHE: Dict[str, Any] = {}
+
+# (signature of matching env items, parsed overrides) from the last scan.
+_ENV_CACHE: Optional[Tuple[int, dict]] = None
+
+
+def _coerce_env_value(value: str) -> Any:
+    try:
+        return _COERCE_CACHE[value]
+    except KeyError:
+        pass
+    literal = _ENV_LITERALS.get(value)
+    if literal is None and value[:1] in "tTfF":
+        literal = _ENV_LITERALS.get(value.lower())
+    if literal is not None:
+        coerced: Any = literal
+    elif value.isdecimal():
+        coerced = int(value)
+    elif value[:1] in _JSON_LEAD_CHARS:
+        try:
+            coerced = json.loads(value)
+        except Exception:
+            coerced = value
+    else:
+        coerced = value
+    _COERCE_CACHE[value] = coerced
+    return coerced
+
+
 def _env_overrides() -> dict:
-    prefix = "EVOSUITE_AGENT_OS_"
+    global _ENV_CACHE
+    matching = [
+        (key, value)
+        for key, value in os.environ.items()
+        if key.startswith(_ENV_PREFIX)
+    ]
+    sig = hash(tuple(matching))
+    if _ENV_CACHE is not None and _ENV_CACHE[0] == sig:
+        return _copy_config(_ENV_CACHE[1])
     overrides: Dict[str, Any] = {}
-    for key, value in os.environ.items():
-        if not key.startswith(prefix):
-            continue
-        path_str = key[len(prefix) :].lower()  # e.g. LOG_LEVEL or SAMPLING__MAX_PARALLEL
+    for key, value in matching:
+        path_str = key[_ENV_PREFIX_LEN:].lower()  # e.g. LOG_LEVEL or SAMPLING__MAX_PARALLEL
         parts = path_str.split("__")
         target = overrides
         for p in parts[:-1]:
             target = target.setdefault(p, {})  # type: ignore
-        leaf = parts[-1]
-        # Basic type coercion
-        if value.isdigit():
-            coerced: Any = int(value)
-        elif value.lower() in {"true", "false"}:
-            coerced = value.lower() == "true"
-        else:
-            try:
-                coerced = json.loads(value)
-            except Exception:
-                coerced = value
-        target[leaf] = coerced  # type: ignore
+        target[parts[-1]] = _coerce_env_value(value)  # type: ignore
+    _ENV_CACHE = (sig, _copy_config(overrides))
     return overrides
 
 
-def load_agent_os_config(workspace_root: Path) -> dict:
+def _packaged_defaults(shallow: bool = False) -> dict:
+    """Return the packaged defaults layer.
+
+    Wheels ship a pre-compiled ``defaults/_compiled.py`` (see
+    ``hatch_build.py``) whose dict literal imports for free; source
+    checkouts fall back to parsing ``defaults/config.*``.
+    """
+    if not shallow:
+        try:
+            from .defaults._compiled import DEFAULTS  # type: ignore
+        except ImportError:
+            pass
+        else:
+            return _copy_config(DEFAULTS)
+    return _collect_layer_config(_PKG_DEFAULTS_DIR, shallow=shallow)
+
+
+# Memoized results of load_agent_os_config, keyed by resolved workspace
+# root. Each entry pairs the layer/env signature it was computed from with
+# the merged dict; a stale signature evicts the entry.
+_CACHE: Dict[Path, Tuple[tuple, dict]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _layer_mtime_ns(dir_path: Path) -> Optional[int]:
+    """Return the mtime of the layer's active config file, if any."""
+    for name in CONFIG_FILENAMES:
+        try:
+            return (dir_path / name).stat().st_mtime_ns
+        except OSError:
+            continue
+    return None
+
+
+def _cache_signature(workspace_root: Path) -> tuple:
+    env_items = tuple(
+        sorted(item for item in os.environ.items() if item[0].startswith(_ENV_PREFIX))
+    )
+    return (
+        _layer_mtime_ns(_PKG_DEFAULTS_DIR),
+        _layer_mtime_ns(_platform_user_config_root()),
+        _layer_mtime_ns(workspace_root / ".agent-os"),
+        hash(env_items),
+    )
+
+
+def load_agent_os_config(workspace_root: Path, shallow: bool = False) -> dict:
     """Load layered Agent OS configuration.
 
+    Results are memoized per workspace: repeat calls cost a few ``stat()``
+    calls plus an environment scan, and the cache is invalidated whenever a
+    layer file's mtime or an ``EVOSUITE_AGENT_OS_*`` variable changes.
+
     Args:
         workspace_root: Path to project root containing optional .agent-os/
+        shallow: Parse only the leading top-level keys of YAML layers
+            (version dispatch, logging level checks); the result may omit
+            keys defined deeper in large files and is never memoized.
     Returns:
         Merged configuration dictionary with provenance markers.
     """
-    merged: Dict[str, Any] = {"_provenance": []}
-
-    # 1. Packaged defaults (relative to this file: defaults/config.*)
-    pkg_defaults_dir = Path(__file__).parent / "defaults"
-    defaults_cfg = _collect_layer_config(pkg_defaults_dir)
-    if defaults_cfg:
-        _deep_merge(merged, defaults_cfg)
-        merged["_provenance"].append("package")
+    cache_key = workspace_root.resolve()
+    if not shallow:
+        signature = _cache_signature(cache_key)
+        with _CACHE_LOCK:
+            cached = _CACHE.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                return _copy_config(cached[1])
 
-    # 2. User global overrides
+    # Read and parse the three file layers concurrently; I/O waits overlap,
+    # and the libyaml/orjson parse paths release the GIL. Merging below
+    # still happens strictly in precedence order.
     user_dir = _platform_user_config_root()
-    user_cfg = _collect_layer_config(user_dir)
-    if user_cfg:
-        _deep_merge(merged, user_cfg)
-        merged["_provenance"].append(str(user_dir))
-
-    # 3. Workspace overrides
     ws_dir = workspace_root / ".agent-os"
-    ws_cfg = _collect_layer_config(ws_dir)
-    if ws_cfg:
-        _deep_merge(merged, ws_cfg)
-        merged["_provenance"].append(str(ws_dir))
+    layer_tasks = [
+        ("package", functools.partial(_packaged_defaults, shallow)),  # 1. Packaged defaults
+        (str(user_dir), functools.partial(_collect_layer_config, user_dir, shallow)),  # 2. User global overrides
+        (str(ws_dir), functools.partial(_collect_layer_config, ws_dir, shallow)),  # 3. Workspace overrides
+    ]
+    with ThreadPoolExecutor(max_workers=len(layer_tasks)) as pool:
+        futures = [pool.submit(task) for _, task in layer_tasks]
+        layer_cfgs = [future.result() for future in futures]
 
     # 4. Environment overrides
-    env_cfg = _env_overrides()
-    if env_cfg:
-        _deep_merge(merged, env_cfg)
-        merged["_provenance"].append("env")
+    layers = list(zip((p for p, _ in layer_tasks), layer_cfgs)) + [
+        ("env", _env_overrides())
+    ]
+    active = [(provenance, cfg) for provenance, cfg in layers if cfg]
+
+    # Fold layers sequentially into the accumulator: _deep_merge is not
+    # associative (a scalar override in a middle layer must mask, not be
+    # re-merged with, lower-layer dicts), so pairwise tree merging would
+    # change results.
+    merged: Dict[str, Any] = {}
+    for _, cfg in active:
+        _deep_merge(merged, cfg)
+    merged["_provenance"] = [provenance for provenance, _ in active]
 
+    if not shallow:
+        with _CACHE_LOCK:
+            _CACHE[cache_key] = (signature, _copy_config(merged))
     return merged
 
 
@@ -1,6 +1,6 @@
 """Agent OS coordinator for multi-agent orchestration."""
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 from pathlib import Path
 import asyncio
 import logging
@@ -14,7 +14,7 @@ class AgentCoordinator:
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         self.agents: Dict[str, Any] = {}
-        self.active_tasks: List[str] = []
+        self.active_tasks: Set[str] = set()
     
     async def register_agent(self, name: str, agent_instance: Any) -> None:
         """Register an agent with the coordinator."""
@@ -22,19 +22,66 @@ class AgentCoordinator:
         logger.info(f"Registered agent: {name}")
     
     async def execute_workflow(self, workflow_spec: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a multi-agent workflow based on specification."""
-        results = {}
-        
-        for step in workflow_spec.get("steps", []):
+        """Execute a multi-agent workflow based on specification.
+
+        Steps may declare ``depends_on`` (a list of step names); independent
+        steps within the same dependency wave run concurrently. Specs that
+        set ``"sequential": true`` keep the legacy one-step-at-a-time order.
+        """
+        agents = self.agents
+        named = []
+        seen_names = set()
+        for idx, step in enumerate(workflow_spec.get("steps", ())):
             agent_name = step.get("agent")
-            if agent_name not in self.agents:
+            if agents.get(agent_name) is None:
                 raise ValueError(f"Agent '{agent_name}' not found")
-            
-            # Execute step with the specified agent
-            result = await self._execute_step(step)
-            results[step.get("name", f"step_{len(results)}")] = result
-        
+            name = step.get("name") or f"step_{idx}"
+            if name in seen_names:
+                # Names key both the results dict and the dependency DAG;
+                # a collision would silently drop or misorder a step.
+                raise ValueError(f"Duplicate step name '{name}'")
+            seen_names.add(name)
+            named.append((name, step))
+
+        results: Dict[str, Any] = {}
+
+        if workflow_spec.get("sequential"):
+            for name, step in named:
+                results[name] = await self._execute_step(step)
+            return results
+
+        for wave in self._dependency_waves(named):
+            gathered = await asyncio.gather(
+                *(self._execute_step(step) for _, step in wave)
+            )
+            for (name, _), result in zip(wave, gathered):
+                results[name] = result
+
         return results
+
+    @staticmethod
+    def _dependency_waves(named_steps: List[tuple]) -> List[List[tuple]]:
+        """Topologically group (name, step) pairs into concurrent waves."""
+        known = {name for name, _ in named_steps}
+        pending = list(named_steps)
+        done: set = set()
+        waves: List[List[tuple]] = []
+        while pending:
+            wave = []
+            for name, step in pending:
+                deps = step.get("depends_on", [])
+                unknown = [d for d in deps if d not in known]
+                if unknown:
+                    raise ValueError(f"Step '{name}' depends on unknown step(s): {unknown}")
+                if all(d in done for d in deps):
+                    wave.append((name, step))
+            if not wave:
+                stuck = [name for name, _ in pending]
+                raise ValueError(f"Dependency cycle among steps: {stuck}")
+            done.update(name for name, _ in wave)
+            pending = [item for item in pending if item[0] not in done]
+            waves.append(wave)
+        return waves
     
     async def _execute_step(self, step: Dict[str, Any]) -> Any:
         """Execute a single workflow step."""
@@ -0,0 +1,5 @@
+"""Packaged default Agent OS configuration.
+
+Ships either as ``config.yaml`` (parsed at runtime) or, in built wheels,
+as the pre-compiled ``_compiled.py`` module generated by ``hatch_build.py``.
+"""
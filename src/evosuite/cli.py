@@ -1,12 +1,10 @@
 """EvoSuite command-line interface."""
 
 import click
+import functools
 from pathlib import Path
 from typing import Optional
 
-from .agent_os.config import load_agent_os_config
-from .agent_os.coordinator import AgentCoordinator
-
 
 @click.group()
 @click.version_option()
@@ -21,6 +19,8 @@ def main():
 @click.option("--show-provenance", is_flag=True, help="Show configuration provenance")
 def config(workspace: Path, show_provenance: bool):
     """Show current configuration."""
+    from .agent_os.config import load_agent_os_config
+
     cfg = load_agent_os_config(workspace)
     
     if show_provenance:
@@ -63,21 +63,24 @@ sampling:
     click.echo("✅ Agent OS initialized successfully")
 
 
+@functools.cache
+def _discover_plugins():
+    """Discover installed plugin entry points (cached per process)."""
+    from importlib.metadata import entry_points
+    return tuple(entry_points(group='evosuite.plugins'))
+
+
 @main.command()
 def plugins():
     """List available plugins."""
-    try:
-        import pkg_resources
-        plugins = list(pkg_resources.iter_entry_points('evosuite.plugins'))
-        
-        if plugins:
-            click.echo("Available plugins:")
-            for plugin in plugins:
-                click.echo(f"  {plugin.name} = {plugin.module_name}")
-        else:
-            click.echo("No plugins found. Install evosuite-plugins-official or evosuite-providers.")
-    except ImportError:
-        click.echo("Plugin discovery requires setuptools/pkg_resources")
+    discovered = _discover_plugins()
+
+    if discovered:
+        click.echo("Available plugins:")
+        for plugin in discovered:
+            click.echo(f"  {plugin.name} = {plugin.value}")
+    else:
+        click.echo("No plugins found. Install evosuite-plugins-official or evosuite-providers.")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,12 @@
 """Plugin system base classes and interfaces."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel
 
 
-class PluginMetadata(BaseModel):
+@dataclass(slots=True)
+class PluginMetadata:
     """Metadata for plugin registration."""
     name: str
     version: str